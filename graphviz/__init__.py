@@ -26,10 +26,12 @@ Example:
     }
 """
 
-from ._defaults import set_default_engine, set_default_format, set_jupyter_format
+from ._defaults import (set_default_engine, set_default_format, set_jupyter_format,
+                        set_pipe_cache_size)
 
 from .backend import (DOT_BINARY, UNFLATTEN_BINARY,
                       render, pipe, pipe_string, pipe_lines, pipe_lines_string,
+                      pipe_many, pipe_async, render_async,
                       unflatten, version, view)
 from .exceptions import (RequiredArgumentError, FileExistsError,
                          UnknownSuffixWarning, FormatSuffixMismatchWarning,
@@ -47,11 +49,13 @@ __all__ = ['ENGINES', 'FORMATS', 'RENDERERS', 'FORMATTERS',
            'Source',
            'escape', 'nohtml',
            'render', 'pipe', 'pipe_string', 'pipe_lines', 'pipe_lines_string',
+           'pipe_many', 'pipe_async', 'render_async',
            'unflatten', 'version', 'view',
            'RequiredArgumentError', 'FileExistsError',
            'UnknownSuffixWarning', 'FormatSuffixMismatchWarning',
            'ExecutableNotFound, CalledProcessError',
-           'set_default_engine', 'set_default_format', 'set_jupyter_format']
+           'set_default_engine', 'set_default_format', 'set_jupyter_format',
+           'set_pipe_cache_size']
 
 __title__ = 'graphviz'
 __version__ = '0.19.2.dev0'
@@ -1,7 +1,8 @@
-"""Set package-wide default parameters and IPython/Jupyter display format."""
+"""Set package-wide default parameters, IPython/Jupyter display format, and pipe cache size."""
 
 __all_ = ['DEFAULT_SOURCE_EXTENSION',
-          'set_default_engine', 'set_default_format', 'set_jupyter_format']
+          'set_default_engine', 'set_default_format', 'set_jupyter_format',
+          'set_pipe_cache_size']
 
 DEFAULT_SOURCE_EXTENSION = 'gv'
 
@@ -68,3 +69,30 @@ def set_jupyter_format(jupyter_format: str) -> str:
 
     jupyter_integration.JupyterIntegration._jupyter_mimetype = mimetype
     return old_format
+
+
+def set_pipe_cache_size(maxsize: int) -> int:
+    """Change the number of cached ``pipe()`` outputs and return the old value.
+
+    Args:
+        maxsize: new maximal number of outputs kept in memory
+            and returned for repeated identical ``pipe()`` calls
+            without running the layout subprocess again
+            (``0`` disables caching, default).
+
+    Returns:
+        The old value used for the maximal number of cached outputs.
+
+    Raises:
+        TypeError: If ``maxsize`` is not an ``int`` (or is a ``bool``).
+        ValueError: If ``maxsize`` is negative.
+
+    Note:
+        Only successful calls are cached.
+        The cache does not track files referenced by the DOT source
+        (e.g. ``[image=...]``) or ``stderr`` output:
+        Warnings are shown for the first (uncached) call only.
+    """
+    from .backend import caching
+
+    return caching.PIPE_CACHE.set_maxsize(maxsize)
@@ -3,16 +3,18 @@
 from .dot_command import DOT_BINARY
 from .execute import ExecutableNotFound, CalledProcessError
 from .mixins import Render, Pipe, Unflatten, View
-from .piping import pipe, pipe_string, pipe_lines, pipe_lines_string
-from .rendering import render
+from .piping import (pipe, pipe_string, pipe_lines, pipe_lines_string,
+                     pipe_many, pipe_async)
+from .rendering import render, render_async
 from .unflattening import UNFLATTEN_BINARY, unflatten
 from .upstream_version import version
 from .viewing import view
 
 __all__ = ['DOT_BINARY', 'UNFLATTEN_BINARY',
-           'render',
+           'render', 'render_async',
            'pipe', 'pipe_string',
            'pipe_lines', 'pipe_lines_string',
+           'pipe_many', 'pipe_async',
            'unflatten',
            'version',
            'view',
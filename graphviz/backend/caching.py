@@ -0,0 +1,100 @@
+"""Cache the output of piping identical DOT source through Graphviz ``dot``."""
+
+import collections
+import hashlib
+import logging
+import os
+import threading
+import typing
+
+__all__ = ['PipeCache', 'PIPE_CACHE']
+
+
+log = logging.getLogger(__name__)
+
+
+class PipeCache:
+    """Thread-safe least recently used mapping from layout command and input to output.
+
+    >>> cache = PipeCache(maxsize=1)  # doctest: +NO_EXE
+    >>> key = cache.make_key(['dot', '-Tsvg'], b'graph { spam }')
+    >>> cache.put(key, b'<svg/>')
+    >>> cache.get(key)
+    b'<svg/>'
+
+    >>> cache.put(cache.make_key(['dot', '-Tsvg'], b'graph { eggs }'), b'<svg/>')
+    >>> cache.get(key)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    KeyError: ...
+    """
+
+    def __init__(self, *, maxsize: int = 0) -> None:
+        self._maxsize = self._verify_maxsize(maxsize)
+        self._lock = threading.Lock()
+        self._outputs = collections.OrderedDict()
+
+    @staticmethod
+    def _verify_maxsize(maxsize: int) -> int:
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(f'maxsize must be an int: {maxsize!r}')
+        if maxsize < 0:
+            raise ValueError(f'maxsize must be non-negative: {maxsize!r}')
+        return maxsize
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    @property
+    def maxsize(self) -> int:
+        """Maximal number of cached outputs (``0`` disables caching)."""
+        return self._maxsize
+
+    def set_maxsize(self, maxsize: int) -> int:
+        """Change ``maxsize``, drop the least recently used outputs
+            exceeding it, and return the old value."""
+        maxsize = self._verify_maxsize(maxsize)
+        with self._lock:
+            old_maxsize, self._maxsize = self._maxsize, maxsize
+            self._shrink()
+        return old_maxsize
+
+    @staticmethod
+    def make_key(cmd: typing.Sequence[typing.Union[os.PathLike, str]],
+                 input: typing.Union[bytes, str], *,
+                 encoding: typing.Optional[str] = None) -> typing.Tuple:
+        """Return the cache key for piping ``input`` through ``cmd``."""
+        if isinstance(input, str):
+            input = input.encode('utf-8', 'surrogatepass')
+        digest = hashlib.blake2b(input).digest()
+        return tuple(map(os.fspath, cmd)), encoding, digest
+
+    def get(self, key: typing.Tuple) -> typing.Union[bytes, str]:
+        """Return the cached output for ``key`` (raise ``KeyError`` if missing)."""
+        with self._lock:
+            output = self._outputs[key]
+            self._outputs.move_to_end(key)
+        log.debug('pipe cache hit %r', key[0])
+        return output
+
+    def put(self, key: typing.Tuple, output: typing.Union[bytes, str]) -> None:
+        """Cache ``output`` under ``key`` (no-op if caching is disabled)."""
+        with self._lock:
+            if not self._maxsize:
+                return None
+            self._outputs[key] = output
+            self._outputs.move_to_end(key)
+            self._shrink()
+        return None
+
+    def clear(self) -> None:
+        """Drop all cached outputs."""
+        with self._lock:
+            self._outputs.clear()
+
+    def _shrink(self) -> None:
+        while len(self._outputs) > self._maxsize:
+            self._outputs.popitem(last=False)
+
+
+PIPE_CACHE = PipeCache()
@@ -1,5 +1,6 @@
 """Check and assemble commands for running Graphviz ``dot``."""
 
+import functools
 import os
 import pathlib
 import typing
@@ -7,7 +8,7 @@ import typing
 from .. import exceptions
 from .. import parameters
 
-__all__ = ['DOT_BINARY', 'command']
+__all__ = ['DOT_BINARY', 'command', 'output_format']
 
 DOT_BINARY = pathlib.Path('dot')
 
@@ -18,20 +19,69 @@ def command(engine: str, format_: str, *,
             ) -> typing.List[typing.Union[os.PathLike, str]]:
     """Return ``subprocess.Popen`` argument list for rendering.
 
+    >>> command('dot', 'svg')[1:]  # doctest: +NO_EXE
+    ['-Kdot', '-Tsvg']
+
+    >>> command('dot', 'ps', renderer='ps', formatter='core')[1:]
+    ['-Kdot', '-Tps:ps:core']
+
+    >>> command('spam', 'nonformat')  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    ValueError: unknown engine: 'spam' (must be one of [...])
+
     See also:
         Upstream documentation:
         - https://www.graphviz.org/doc/info/command.html#-K
         - https://www.graphviz.org/doc/info/command.html#-T
     """
+    return [DOT_BINARY, *_command_flags(engine, format_, renderer, formatter)]
+
+
+@functools.lru_cache(maxsize=256)
+def _command_flags(engine: str, format_: str,
+                   renderer: typing.Optional[str],
+                   formatter: typing.Optional[str]) -> typing.Tuple[str, str]:
+    """Return the verified ``-K`` and ``-T`` arguments (cached)."""
     if formatter is not None and renderer is None:
         raise exceptions.RequiredArgumentError('formatter given without renderer')
 
     parameters.verify_engine(engine, required=True)
+    output_format_flag, _ = output_format(format_,
+                                          renderer=renderer, formatter=formatter)
+    return f'-K{engine}', f'-T{output_format_flag}'
+
+
+@functools.lru_cache(maxsize=256)
+def output_format(format_: str, *,
+                  renderer: typing.Optional[str] = None,
+                  formatter: typing.Optional[str] = None) -> typing.Tuple[str, str]:
+    """Return verified ``-T`` value and matching ``-O`` output file suffix (cached).
+
+    >>> output_format('svg')  # doctest: +NO_EXE
+    ('svg', 'svg')
+
+    >>> output_format('ps', renderer='ps', formatter='core')
+    ('ps:ps:core', 'core.ps.ps')
+
+    See also:
+        Upstream documentation:
+        - https://www.graphviz.org/doc/info/command.html#-T
+        - https://www.graphviz.org/doc/info/command.html#-O
+    """
+    if formatter is not None and renderer is None:
+        raise exceptions.RequiredArgumentError('formatter given without renderer')
+
     parameters.verify_format(format_, required=True)
     parameters.verify_renderer(renderer, required=False)
     parameters.verify_formatter(formatter, required=False)
 
-    output_format = [f for f in (format_, renderer, formatter) if f is not None]
-    output_format_flag = ':'.join(output_format)
+    flag = suffix = format_
+    if renderer is not None:
+        flag = f'{format_}:{renderer}'
+        suffix = f'{renderer}.{format_}'
+        if formatter is not None:
+            flag += f':{formatter}'
+            suffix = f'{formatter}.{suffix}'
 
-    return [DOT_BINARY, f'-K{engine}', f'-T{output_format_flag}']
+    return flag, suffix
@@ -1,5 +1,6 @@
 """Run subprocesses with ``subprocess.run()`` and ``subprocess.Popen()``."""
 
+import contextlib
 import errno
 import logging
 import os
@@ -9,7 +10,8 @@ import typing
 
 from .. import _compat
 
-__all__ = ['run_check', 'ExecutableNotFound', 'CalledProcessError']
+__all__ = ['run_check', 'run_check_async',
+           'ExecutableNotFound', 'CalledProcessError']
 
 
 log = logging.getLogger(__name__)
@@ -88,6 +90,63 @@ def run_check(cmd: typing.Sequence[typing.Union[os.PathLike, str]], *,
             raise ExecutableNotFound(cmd) from e
         raise
 
+    _check_completed(proc, quiet=quiet)
+    return proc
+
+
+async def run_check_async(cmd: typing.Sequence[typing.Union[os.PathLike, str]], *,
+                          input: typing.Optional[bytes] = None,
+                          capture_output: bool = False,
+                          quiet: bool = False,
+                          **kwargs) -> subprocess.CompletedProcess:
+    """Run the command described by ``cmd`` with :mod:`asyncio`
+        and return its completed process (``check=True`` semantics).
+
+    Raises:
+        CalledProcessError: if the returncode of the subprocess is non-zero.
+
+    Note:
+        Bytes only: ``input`` and the returned ``stdout`` and ``stderr``
+        are not en/decoded.
+    """
+    import asyncio  # not imported with graphviz (slow)
+
+    log.debug('run %r', cmd)
+
+    cmd = list(map(_compat.make_subprocess_arg, cmd))
+
+    if capture_output:
+        kwargs['stdout'] = kwargs['stderr'] = subprocess.PIPE
+
+    if input is not None:
+        kwargs['stdin'] = subprocess.PIPE
+
+    kwargs.setdefault('startupinfo', _compat.get_startupinfo())
+
+    try:
+        process = await asyncio.create_subprocess_exec(*cmd, **kwargs)
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            raise ExecutableNotFound(cmd) from e
+        raise
+
+    try:
+        stdout, stderr = await process.communicate(input)
+    except BaseException:  # e.g. asyncio.CancelledError
+        if process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):  # exited meanwhile
+                process.kill()
+        await process.wait()
+        raise
+
+    proc = subprocess.CompletedProcess(cmd, process.returncode,
+                                       stdout=stdout, stderr=stderr)
+
+    _check_completed(proc, quiet=quiet)
+    return proc
+
+
+def _check_completed(proc: subprocess.CompletedProcess, *, quiet: bool) -> None:
     if not quiet and proc.stderr:
         _write_stderr(proc.stderr)
 
@@ -96,8 +155,6 @@ def run_check(cmd: typing.Sequence[typing.Union[os.PathLike, str]], *,
     except subprocess.CalledProcessError as e:
         raise CalledProcessError(*e.args)
 
-    return proc
-
 
 def _run_input_lines(cmd, input_lines, *, kwargs):
     popen = subprocess.Popen(cmd, stdin=subprocess.PIPE, **kwargs)
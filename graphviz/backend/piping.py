@@ -1,14 +1,32 @@
 """Pipe bytes, strings, or string iterators through Graphviz ``dot``."""
 
+import logging
+import os
+import pathlib
+import subprocess
+import tempfile
 import typing
 
+from .._defaults import DEFAULT_SOURCE_EXTENSION
 from .. import _tools
 
+from . import caching
 from . import dot_command
 from . import execute
+from . import rendering
 
 __all__ = ['pipe', 'pipe_string',
-           'pipe_lines', 'pipe_lines_string']
+           'pipe_lines', 'pipe_lines_string',
+           'pipe_many', 'pipe_async']
+
+INPUT_CHUNK_SIZE = 64 * 1024
+
+STDIN_FILE_THRESHOLD = 256 * 1024
+
+MAX_COMMAND_LINE_LENGTH = 32767  # Windows CreateProcess() limit
+
+
+log = logging.getLogger(__name__)
 
 
 @_tools.deprecate_positional_args(supported_number=3)
@@ -47,12 +65,16 @@ def pipe(engine: str, format: str, data: bytes,
 
     Note:
         The layout command is started from the current directory.
+        On Linux, ``data`` larger than 256 KiB is passed to the
+        layout subprocess as an in-memory file instead of through a pipe.
     """
     cmd = dot_command.command(engine, format,
                               renderer=renderer, formatter=formatter)
-    kwargs = {'input': data}
 
-    proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
+    if caching.PIPE_CACHE.maxsize:
+        return _pipe_cached(cmd, data, quiet=quiet)
+
+    proc = _run_input(cmd, data, quiet=quiet)
     return proc.stdout
 
 
@@ -97,6 +119,10 @@ def pipe_string(engine: str, format: str, input_string: str, *,
     """
     cmd = dot_command.command(engine, format,
                               renderer=renderer, formatter=formatter)
+
+    if caching.PIPE_CACHE.maxsize:
+        return _pipe_cached(cmd, input_string, encoding=encoding, quiet=quiet)
+
     kwargs = {'input': input_string, 'encoding': encoding}
 
     proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
@@ -143,8 +169,13 @@ def pipe_lines(engine: str, format: str, input_lines: typing.Iterator[str], *,
         The layout command is started from the current directory.
     """
     cmd = dot_command.command(engine, format,
-                             renderer=renderer, formatter=formatter)
-    kwargs = {'input_lines': (line.encode(input_encoding) for line in input_lines)}
+                              renderer=renderer, formatter=formatter)
+
+    if caching.PIPE_CACHE.maxsize:
+        data = b''.join(_encode_chunks(input_lines, input_encoding))
+        return _pipe_cached(cmd, data, quiet=quiet)
+
+    kwargs = {'input_lines': _encode_chunks(input_lines, input_encoding)}
 
     proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
     return proc.stdout
@@ -191,7 +222,249 @@ def pipe_lines_string(engine: str, format: str, input_lines: typing.Iterator[str
     """
     cmd = dot_command.command(engine, format,
                               renderer=renderer, formatter=formatter)
+
+    if caching.PIPE_CACHE.maxsize:
+        return _pipe_cached(cmd, ''.join(input_lines), encoding=encoding, quiet=quiet)
+
     kwargs = {'input_lines': input_lines, 'encoding': encoding}
 
     proc = execute.run_check(cmd, capture_output=True, quiet=quiet, **kwargs)
     return proc.stdout
+
+
+def pipe_many(engine: str, format: str, sources: typing.Iterable[bytes], *,
+              renderer: typing.Optional[str] = None,
+              formatter: typing.Optional[str] = None,
+              quiet: bool = False) -> typing.List[bytes]:
+    """Return ``sources`` rendered with a single ``engine`` call into ``format``.
+
+    Args:
+        engine: Layout engine for rendering (``'dot'``, ``'neato'``, ...).
+        format: Output format for rendering (``'pdf'``, ``'png'``, ...).
+        sources: Binary (encoded) DOT source bytes to render
+            (one graph each).
+        renderer: Output renderer (``'cairo'``, ``'gd'``, ...).
+        formatter: Output formatter (``'cairo'``, ``'gd'``, ...).
+        quiet: Suppress ``stderr`` output from the layout subprocess.
+
+    Returns:
+        List of the binary (encoded) rendered outputs
+        in the order of ``sources``.
+
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter``
+            are unknown.
+        graphviz.RequiredArgumentError: If ``formatter`` is given
+            but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+            is not found.
+        graphviz.CalledProcessError: If the returncode (exit status)
+            of the rendering ``dot`` subprocess is non-zero.
+
+    Example:
+        >>> doctest_mark_exe()
+        >>> import graphviz
+        >>> [out[:14] for out in graphviz.pipe_many('dot', 'svg',
+        ...                                         [b'graph { spam }',
+        ...                                          b'graph { eggs }'])]
+        [b'<?xml version=', b'<?xml version=']
+
+    Note:
+        The ``sources`` are written into a temporary directory
+        and rendered by one layout subprocess
+        (saving one process startup per source).
+        If the resulting command line would exceed
+        ``MAX_COMMAND_LINE_LENGTH``, the ``sources`` are split
+        into several layout subprocesses.
+        The layout command is started from the current directory.
+
+    Warning:
+        A single invalid source raises :exc:`graphviz.CalledProcessError`
+        for the whole call and none of the outputs are returned.
+    """
+    cmd = dot_command.command(engine, format,
+                              renderer=renderer, formatter=formatter)
+
+    with tempfile.TemporaryDirectory(prefix='graphviz-') as tmpdir:
+        filepaths = []
+        for index, data in enumerate(sources):
+            filepath = pathlib.Path(tmpdir, f'{index}.{DEFAULT_SOURCE_EXTENSION}')
+            filepath.write_bytes(data)
+            filepaths.append(filepath)
+
+        if not filepaths:
+            return []
+
+        outfiles = [rendering.get_outfile(f, format=format,
+                                          renderer=renderer,
+                                          formatter=formatter)
+                    for f in filepaths]
+
+        # https://www.graphviz.org/doc/info/command.html#-O
+        cmd.append('-O')
+
+        for batch in _batch_args(filepaths, cmd=cmd):
+            execute.run_check(cmd + batch, quiet=quiet,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        return [o.read_bytes() for o in outfiles]
+
+
+async def pipe_async(engine: str, format: str, data: bytes, *,
+                     renderer: typing.Optional[str] = None,
+                     formatter: typing.Optional[str] = None,
+                     quiet: bool = False) -> bytes:
+    """Return ``data`` piped through ``engine`` into ``format`` as ``bytes`` (coroutine).
+
+    Args:
+        engine: Layout engine for rendering (``'dot'``, ``'neato'``, ...).
+        format: Output format for rendering (``'pdf'``, ``'png'``, ...).
+        data: Binary (encoded) DOT source bytes to render.
+        renderer: Output renderer (``'cairo'``, ``'gd'``, ...).
+        formatter: Output formatter (``'cairo'``, ``'gd'``, ...).
+        quiet: Suppress ``stderr`` output from the layout subprocess.
+
+    Returns:
+        Binary (encoded) stdout of the layout command.
+
+    Raises:
+        ValueError: If ``engine``, ``format``, ``renderer``, or ``formatter``
+            are unknown.
+        graphviz.RequiredArgumentError: If ``formatter`` is given
+            but ``renderer`` is None.
+        graphviz.ExecutableNotFound: If the Graphviz ``dot`` executable
+            is not found.
+        graphviz.CalledProcessError: If the returncode (exit status)
+            of the rendering ``dot`` subprocess is non-zero.
+
+    Example:
+        >>> doctest_mark_exe()
+        >>> import asyncio
+        >>> import graphviz
+        >>> async def pipe_all(*sources):
+        ...     return await asyncio.gather(*[graphviz.pipe_async('dot', 'svg', s)
+        ...                                   for s in sources])
+        >>> loop = asyncio.new_event_loop()
+        >>> [out[:14] for out in loop.run_until_complete(pipe_all(b'graph { spam }',
+        ...                                                       b'graph { eggs }'))]
+        [b'<?xml version=', b'<?xml version=']
+        >>> loop.close()
+
+    Note:
+        The layout command is started from the current directory.
+        Use :func:`asyncio.gather` to run several layout commands concurrently.
+        On Windows before Python 3.8, subprocesses require
+        an :class:`asyncio.ProactorEventLoop` (not the default event loop).
+    """
+    cmd = dot_command.command(engine, format,
+                              renderer=renderer, formatter=formatter)
+
+    proc = await execute.run_check_async(cmd, input=data,
+                                         capture_output=True, quiet=quiet)
+    return proc.stdout
+
+
+def _pipe_cached(cmd: typing.Sequence[typing.Union[os.PathLike, str]],
+                 input: typing.Union[bytes, str], *,
+                 encoding: typing.Optional[str] = None,
+                 quiet: bool = False) -> typing.Union[bytes, str]:
+    """Return cached stdout of piping ``input`` through ``cmd`` (run on cache miss)."""
+    key = caching.PIPE_CACHE.make_key(cmd, input, encoding=encoding)
+    try:
+        return caching.PIPE_CACHE.get(key)
+    except KeyError:
+        pass
+
+    if encoding is None:
+        proc = _run_input(cmd, input, quiet=quiet)
+    else:
+        proc = execute.run_check(cmd, input=input, encoding=encoding,
+                                 capture_output=True, quiet=quiet)
+
+    caching.PIPE_CACHE.put(key, proc.stdout)
+    return proc.stdout
+
+
+def _encode_chunks(lines: typing.Iterable[str], encoding: str, *,
+                   chunk_size: int = INPUT_CHUNK_SIZE) -> typing.Iterator[bytes]:
+    r"""Yield ``lines`` joined into chunks of about ``chunk_size`` characters and encoded.
+
+    >>> list(_encode_chunks(iter(['spam\n', 'eggs\n']), 'ascii'))  # doctest: +NO_EXE
+    [b'spam\neggs\n']
+
+    >>> list(_encode_chunks(iter(['spam\n', 'eggs\n']), 'ascii', chunk_size=5))
+    [b'spam\n', b'eggs\n']
+    """
+    chunk, size = [], 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield ''.join(chunk).encode(encoding)
+            chunk, size = [], 0
+
+    if chunk:
+        yield ''.join(chunk).encode(encoding)
+
+
+def _batch_args(args: typing.Sequence[typing.Union[os.PathLike, str]], *,
+                cmd: typing.Sequence[typing.Union[os.PathLike, str]],
+                max_length: typing.Optional[int] = None
+                ) -> typing.Iterator[typing.List[typing.Union[os.PathLike, str]]]:
+    """Yield ``args`` split into lists fitting ``cmd`` below ``max_length``.
+
+    >>> list(_batch_args(['spam', 'eggs', 'ham'], cmd=['dot'], max_length=20))  # doctest: +NO_EXE
+    [['spam', 'eggs'], ['ham']]
+    """
+    if max_length is None:
+        max_length = MAX_COMMAND_LINE_LENGTH
+
+    # count separating space and possible quotes per argument
+    base_length = sum(len(os.fspath(a)) + 3 for a in cmd)
+
+    batch, length = [], base_length
+    for arg in args:
+        arg_length = len(os.fspath(arg)) + 3
+        if batch and length + arg_length > max_length:
+            yield batch
+            batch, length = [], base_length
+        batch.append(arg)
+        length += arg_length
+
+    if batch:
+        yield batch
+
+
+def _run_input(cmd: typing.Sequence[typing.Union[os.PathLike, str]],
+               data: bytes, *, quiet: bool) -> subprocess.CompletedProcess:
+    """Run ``cmd`` with ``data`` as stdin (large ``data`` from an in-memory file)."""
+    if len(data) > STDIN_FILE_THRESHOLD:
+        stdin = _open_memfd(data)
+        if stdin is not None:
+            with stdin:
+                return execute.run_check(cmd, stdin=stdin,
+                                         capture_output=True, quiet=quiet)
+
+    return execute.run_check(cmd, input=data, capture_output=True, quiet=quiet)
+
+
+def _open_memfd(data: bytes) -> typing.Optional[typing.BinaryIO]:
+    """Return an in-memory file with ``data`` or ``None`` if unavailable."""
+    if not hasattr(os, 'memfd_create'):
+        return None
+
+    try:
+        fd = os.memfd_create('graphviz-pipe-input')
+    except OSError as e:  # e.g. ENOSYS (old kernel), EPERM (seccomp)
+        log.debug('os.memfd_create() failed: %r', e)
+        return None
+
+    stdin = open(fd, 'w+b')
+    try:
+        stdin.write(data)
+        stdin.seek(0)
+    except OSError as e:  # e.g. ENOMEM/ENOSPC (cgroup limit), EFBIG (rlimit)
+        log.debug('writing to memfd failed: %r', e)
+        stdin.close()
+        return None
+    return stdin
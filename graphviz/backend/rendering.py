@@ -2,6 +2,7 @@
 
 import os
 import pathlib
+import subprocess
 import typing
 import warnings
 
@@ -13,7 +14,7 @@ from .. import parameters
 from . import dot_command
 from . import execute
 
-__all__ = ['get_format', 'get_filepath', 'render']
+__all__ = ['get_format', 'get_filepath', 'render', 'render_async']
 
 
 def get_format(outfile: pathlib.Path, *, format: typing.Optional[str]) -> str:
@@ -139,12 +140,8 @@ def get_outfile(filepath: typing.Union[os.PathLike, str], *,
     """
     filepath = _tools.promote_pathlike(filepath)
 
-    parameters.verify_format(format, required=True)
-    parameters.verify_renderer(renderer, required=False)
-    parameters.verify_formatter(formatter, required=False)
-
-    suffix_args = (formatter, renderer, format)
-    suffix = '.'.join(a for a in suffix_args if a is not None)
+    _, suffix = dot_command.output_format(format,
+                                          renderer=renderer, formatter=formatter)
     return filepath.with_suffix(f'{filepath.suffix}.{suffix}')
 
 
@@ -269,6 +266,61 @@ def render(engine: str,
     See also:
         Upstream docs: https://www.graphviz.org/doc/info/command.html
     """
+    cmd, cwd, outfile = _get_render_args(engine, format, filepath,
+                                         renderer=renderer, formatter=formatter,
+                                         outfile=outfile,
+                                         raise_if_result_exists=raise_if_result_exists,
+                                         overwrite_filepath=overwrite_filepath)
+
+    execute.run_check(cmd, cwd=cwd, quiet=quiet,
+                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    return os.fspath(outfile)
+
+
+async def render_async(engine: str,
+                       format: typing.Optional[str] = None,
+                       filepath: typing.Union[os.PathLike, str, None] = None, *,
+                       renderer: typing.Optional[str] = None,
+                       formatter: typing.Optional[str] = None,
+                       quiet: bool = False,
+                       outfile: typing.Union[os.PathLike, str, None] = None,
+                       raise_if_result_exists: bool = False,
+                       overwrite_filepath: bool = False) -> str:
+    """Render file with ``engine`` into ``format`` and return result filename (coroutine).
+
+    Accepts the same arguments as :func:`graphviz.render`
+    and raises and warns in the same cases.
+    Use :func:`asyncio.gather` to run several layout commands concurrently.
+
+    Note:
+        On Windows before Python 3.8, subprocesses require
+        an :class:`asyncio.ProactorEventLoop` (not the default event loop).
+    """
+    cmd, cwd, outfile = _get_render_args(engine, format, filepath,
+                                         renderer=renderer, formatter=formatter,
+                                         outfile=outfile,
+                                         raise_if_result_exists=raise_if_result_exists,
+                                         overwrite_filepath=overwrite_filepath)
+
+    await execute.run_check_async(cmd, cwd=cwd, quiet=quiet,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    return os.fspath(outfile)
+
+
+def _get_render_args(engine: str,
+                     format: typing.Optional[str],
+                     filepath: typing.Union[os.PathLike, str, None], *,
+                     renderer: typing.Optional[str],
+                     formatter: typing.Optional[str],
+                     outfile: typing.Union[os.PathLike, str, None],
+                     raise_if_result_exists: bool,
+                     overwrite_filepath: bool
+                     ) -> typing.Tuple[typing.List[typing.Union[os.PathLike, str]],
+                                       typing.Optional[pathlib.Path],
+                                       pathlib.Path]:
+    """Return ``(cmd, cwd, outfile)`` for rendering ``filepath``."""
     if raise_if_result_exists and overwrite_filepath:
         raise ValueError('overwrite_filepath cannot be combined'
                          ' with raise_if_result_exists')
@@ -314,9 +366,5 @@ def render(engine: str,
 
     cmd += args
 
-    execute.run_check(cmd,
-                      cwd=filepath.parent if filepath.parent.parts else None,
-                      quiet=quiet,
-                      capture_output=True)
-
-    return os.fspath(outfile)
+    cwd = filepath.parent
+    return cmd, (cwd if cwd.parts else None), outfile
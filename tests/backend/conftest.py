@@ -1,5 +1,7 @@
 """pytest fixtures for backend."""
 
+import asyncio
+
 import pytest
 
 
@@ -13,6 +15,53 @@ def mock_popen(mocker):
     yield mocker.patch('subprocess.Popen', autospec=True)
 
 
+@pytest.fixture
+def mock_create_subprocess_exec(mocker):
+    mock = mocker.Mock(name='create_subprocess_exec')
+    process = mock.return_value
+    process.configure_mock(returncode=0)
+    process.communicate.return_value = (b'', b'')
+
+    async def create_subprocess_exec(*args, **kwargs):
+        process = mock(*args, **kwargs)
+        communicate, wait = process.communicate, process.wait
+
+        async def communicate_async(input=None):
+            return communicate(input)
+
+        async def wait_async():
+            return wait()
+
+        return mocker.Mock(returncode=process.returncode,
+                           communicate=communicate_async,
+                           wait=wait_async,
+                           kill=process.kill)
+
+    mocker.patch('asyncio.create_subprocess_exec', new=create_subprocess_exec)
+    yield mock
+
+
+@pytest.fixture
+def run_coroutine():
+    def run_coroutine(coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    yield run_coroutine
+
+
+@pytest.fixture
+def pipe_cache(monkeypatch):
+    from graphviz.backend import caching
+
+    cache = caching.PipeCache(maxsize=8)
+    monkeypatch.setattr('graphviz.backend.caching.PIPE_CACHE', cache)
+    yield cache
+
+
 @pytest.fixture
 def mock_startfile(mocker, platform):
     if platform == 'windows':
@@ -1,10 +1,15 @@
+import asyncio
+import errno
 import io
+import os
 import re
 import subprocess
+import tempfile
 
 import pytest
 
 import graphviz
+from graphviz.backend import piping
 
 import _common
 
@@ -103,6 +108,76 @@ def test_pipe_mocked(capsys, mock_run, quiet):
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
 
 
+@pytest.mark.skipif(not hasattr(os, 'memfd_create'),
+                    reason='requires os.memfd_create()')
+def test_pipe_large_data_mocked(mock_run):
+    data = b'graph { spam }\n' * (2 * piping.STDIN_FILE_THRESHOLD // 15)
+    assert len(data) > piping.STDIN_FILE_THRESHOLD
+
+    def run(cmd, *, stdin, **kwargs):
+        assert stdin.read() == data
+        return subprocess.CompletedProcess(cmd, returncode=0,
+                                           stdout=b'stdout', stderr=b'')
+
+    mock_run.side_effect = run
+
+    assert graphviz.pipe('dot', 'png', data) == b'stdout'
+
+    (cmd,), kwargs = mock_run.call_args
+    assert cmd == [_common.EXPECTED_DOT_BINARY, '-Kdot', '-Tpng']
+    assert 'input' not in kwargs
+    assert kwargs['stdin'].closed
+
+
+def test_pipe_large_data_memfd_unavailable_mocked(monkeypatch, mock_run):
+    def memfd_create(name):
+        raise OSError(errno.ENOSYS, 'Function not implemented')
+
+    monkeypatch.setattr('os.memfd_create', memfd_create, raising=False)
+
+    data = b'graph { spam }\n' * (2 * piping.STDIN_FILE_THRESHOLD // 15)
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=b'stdout',
+                                                        stderr=b'')
+
+    assert graphviz.pipe('dot', 'png', data) == b'stdout'
+
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tpng'],
+                                     input=data,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     startupinfo=_common.StartupinfoMatcher())
+
+
+def test_pipe_large_data_memfd_write_error_mocked(monkeypatch, mocker, mock_run):
+    monkeypatch.setattr('os.memfd_create', mocker.Mock(return_value=-1), raising=False)
+
+    memfd = mocker.create_autospec(io.BufferedRandom, instance=True)
+    memfd.write.side_effect = OSError(errno.ENOSPC, 'No space left on device')
+    mock_open = mocker.Mock(return_value=memfd)
+    monkeypatch.setattr('graphviz.backend.piping.open', mock_open, raising=False)
+
+    data = b'graph { spam }\n' * (2 * piping.STDIN_FILE_THRESHOLD // 15)
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=b'stdout',
+                                                        stderr=b'')
+
+    assert graphviz.pipe('dot', 'png', data) == b'stdout'
+
+    mock_open.assert_called_once_with(-1, 'w+b')
+    memfd.write.assert_called_once_with(data)
+    memfd.close.assert_called_once_with()
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tpng'],
+                                     input=data,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     startupinfo=_common.StartupinfoMatcher())
+
+
 def test_pipe_string_mocked(capsys, mock_run, quiet,
                             encoding='ascii'):
     mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
@@ -171,3 +246,185 @@ def test_pipe_lines_string_mocked(capsys, mock_popen, quiet,
                                        stderr=subprocess.PIPE,
                                        startupinfo=_common.StartupinfoMatcher())
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_many_mocked(capsys, mock_run, quiet):
+    def run(cmd, **kwargs):
+        for filepath in cmd[cmd.index('-O') + 1:]:
+            outfile = filepath.with_suffix(f'{filepath.suffix}.png')
+            outfile.write_bytes(filepath.read_bytes().upper())
+        return subprocess.CompletedProcess(cmd, returncode=0,
+                                           stdout=b'', stderr=b'stderr')
+
+    mock_run.side_effect = run
+
+    assert graphviz.pipe_many('dot', 'png', iter([b'spam', b'eggs']),
+                              quiet=quiet) == [b'SPAM', b'EGGS']
+
+    (cmd,), kwargs = mock_run.call_args
+    assert cmd[:4] == [_common.EXPECTED_DOT_BINARY, '-Kdot', '-Tpng', '-O']
+    assert [f.name for f in cmd[4:]] == ['0.gv', '1.gv']
+    assert kwargs == {'stdout': subprocess.DEVNULL,
+                      'stderr': subprocess.PIPE,
+                      'startupinfo': _common.StartupinfoMatcher()}
+    assert not any(f.exists() for f in cmd[4:])
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_many_batched_mocked(monkeypatch, mock_run):
+    def run(cmd, **kwargs):
+        for filepath in cmd[cmd.index('-O') + 1:]:
+            outfile = filepath.with_suffix(f'{filepath.suffix}.png')
+            outfile.write_bytes(filepath.read_bytes().upper())
+        return subprocess.CompletedProcess(cmd, returncode=0,
+                                           stdout=None, stderr=b'')
+
+    mock_run.side_effect = run
+
+    sources = [b'spam', b'eggs', b'ham']
+    max_length = sum(len(os.fspath(a)) + 3 for a in ['dot', '-Kdot', '-Tpng', '-O'])
+    max_length += 2 * (len(os.path.join(tempfile.gettempdir(),
+                                        'graphviz-xxxxxxxx', '0.gv')) + 3)
+    monkeypatch.setattr('graphviz.backend.piping.MAX_COMMAND_LINE_LENGTH', max_length)
+
+    assert graphviz.pipe_many('dot', 'png', sources) == [b'SPAM', b'EGGS', b'HAM']
+
+    assert mock_run.call_count == 2
+    batches = [[f.name for f in call.args[0][4:]] for call in mock_run.call_args_list]
+    assert batches == [['0.gv', '1.gv'], ['2.gv']]
+
+
+def test_pipe_many_empty_mocked(mock_run):
+    assert graphviz.pipe_many('dot', 'png', []) == []
+
+    mock_run.assert_not_called()
+
+
+def test_pipe_async_mocked(capsys, mock_create_subprocess_exec, run_coroutine,
+                           quiet):
+    process = mock_create_subprocess_exec.return_value
+    process.communicate.return_value = (b'stdout', b'stderr')
+
+    assert run_coroutine(graphviz.pipe_async('dot', 'png', b'nongraph',
+                                             quiet=quiet)) == b'stdout'
+
+    mock_create_subprocess_exec.assert_called_once_with(_common.EXPECTED_DOT_BINARY,
+                                                        '-Kdot', '-Tpng',
+                                                        stdin=subprocess.PIPE,
+                                                        stdout=subprocess.PIPE,
+                                                        stderr=subprocess.PIPE,
+                                                        startupinfo=_common.StartupinfoMatcher())
+    process.communicate.assert_called_once_with(b'nongraph')
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
+def test_pipe_async_called_process_error_mocked(mock_create_subprocess_exec,
+                                                run_coroutine):
+    process = mock_create_subprocess_exec.return_value
+    process.configure_mock(returncode=1)
+    process.communicate.return_value = (b'', b'syntax error in line 1')
+
+    with pytest.raises(graphviz.CalledProcessError, match=r'syntax error') as e:
+        run_coroutine(graphviz.pipe_async('dot', 'png', b'nongraph', quiet=True))
+
+    assert e.value.returncode == 1
+
+
+@pytest.mark.parametrize(
+    'returncode, kill_side_effect',
+    [(None, None),
+     (None, ProcessLookupError),
+     (0, None)],
+    ids=['running', 'exited-before-kill', 'exited'])
+def test_pipe_async_cancelled_mocked(mock_create_subprocess_exec, run_coroutine,
+                                     returncode, kill_side_effect):
+    process = mock_create_subprocess_exec.return_value
+    process.configure_mock(returncode=returncode)
+    process.communicate.side_effect = asyncio.CancelledError
+    process.kill.side_effect = kill_side_effect
+
+    with pytest.raises(asyncio.CancelledError):
+        run_coroutine(graphviz.pipe_async('dot', 'png', b'nongraph'))
+
+    if returncode is None:
+        process.kill.assert_called_once_with()
+    else:
+        process.kill.assert_not_called()
+    process.wait.assert_called_once_with()
+
+
+def test_pipe_cached_mocked(capsys, mock_run, pipe_cache, quiet):
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=b'stdout',
+                                                        stderr=b'stderr')
+
+    assert graphviz.pipe('dot', 'png', b'nongraph', quiet=quiet) == b'stdout'
+    assert graphviz.pipe_lines('dot', 'png', iter(['nongraph']),
+                               input_encoding='ascii', quiet=quiet) == b'stdout'
+
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tpng'],
+                                     input=b'nongraph',
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     startupinfo=_common.StartupinfoMatcher())
+    assert len(pipe_cache) == 1
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+    assert graphviz.pipe('dot', 'svg', b'nongraph', quiet=quiet) == b'stdout'
+
+    assert mock_run.call_count == 2
+    assert len(pipe_cache) == 2
+
+
+@pytest.mark.skipif(not hasattr(os, 'memfd_create'),
+                    reason='requires os.memfd_create()')
+def test_pipe_large_data_cached_mocked(mock_run, pipe_cache):
+    data = b'graph { spam }\n' * (2 * piping.STDIN_FILE_THRESHOLD // 15)
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout=b'stdout',
+                                                        stderr=b'')
+
+    for _ in range(2):
+        assert graphviz.pipe('dot', 'png', data) == b'stdout'
+
+    (cmd,), kwargs = mock_run.call_args
+    assert mock_run.call_count == 1
+    assert 'input' not in kwargs
+    assert kwargs['stdin'].closed
+
+
+def test_pipe_string_cached_mocked(mock_run, pipe_cache, encoding='ascii'):
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=0,
+                                                        stdout='stdout',
+                                                        stderr='')
+
+    assert graphviz.pipe_string('dot', 'png', 'nongraph',
+                                encoding=encoding) == 'stdout'
+    assert graphviz.pipe_lines_string('dot', 'png', iter(['non', 'graph']),
+                                      encoding=encoding) == 'stdout'
+
+    mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
+                                      '-Kdot', '-Tpng'],
+                                     input='nongraph',
+                                     encoding=encoding,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     startupinfo=_common.StartupinfoMatcher())
+
+
+def test_pipe_cached_called_process_error_mocked(mock_run, pipe_cache):
+    mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
+                                                        returncode=1,
+                                                        stdout=b'',
+                                                        stderr=b'')
+
+    for _ in range(2):
+        with pytest.raises(graphviz.CalledProcessError):
+            graphviz.pipe('dot', 'png', b'nongraph', quiet=True)
+
+    assert mock_run.call_count == 2
+    assert not len(pipe_cache)
@@ -113,7 +113,7 @@ def test_render_mocked(capsys, mock_run, quiet, directory,
                        filepath='nonfilepath'):
     mock_run.return_value = subprocess.CompletedProcess(_common.INVALID_CMD,
                                                         returncode=0,
-                                                        stdout='stdout',
+                                                        stdout=None,
                                                         stderr='stderr')
 
     if directory is not None:
@@ -125,13 +125,39 @@ def test_render_mocked(capsys, mock_run, quiet, directory,
 
     mock_run.assert_called_once_with([_common.EXPECTED_DOT_BINARY,
                                       '-Kdot', '-Tpdf', '-O', 'nonfilepath'],
-                                     stdout=subprocess.PIPE,
+                                     stdout=subprocess.DEVNULL,
                                      stderr=subprocess.PIPE,
                                      cwd=_tools.promote_pathlike(directory),
                                      startupinfo=_common.StartupinfoMatcher())
     assert capsys.readouterr() == ('', '' if quiet else 'stderr')
 
 
+@pytest.mark.parametrize(
+    'directory', [None, 'dot_sources'])
+def test_render_async_mocked(capsys, mock_create_subprocess_exec, run_coroutine,
+                             quiet, directory, filepath='nonfilepath'):
+    process = mock_create_subprocess_exec.return_value
+    process.communicate.return_value = (b'', b'stderr')
+
+    if directory is not None:
+        filepath = os.path.join(directory, filepath)
+
+    result = run_coroutine(graphviz.render_async('dot', 'pdf', filepath,
+                                                 quiet=quiet))
+
+    assert result == f'{filepath}.pdf'
+
+    mock_create_subprocess_exec.assert_called_once_with(_common.EXPECTED_DOT_BINARY,
+                                                        '-Kdot', '-Tpdf',
+                                                        '-O', 'nonfilepath',
+                                                        stdout=subprocess.DEVNULL,
+                                                        stderr=subprocess.PIPE,
+                                                        cwd=_tools.promote_pathlike(directory),
+                                                        startupinfo=_common.StartupinfoMatcher())
+    process.communicate.assert_called_once_with(None)
+    assert capsys.readouterr() == ('', '' if quiet else 'stderr')
+
+
 @pytest.mark.parametrize(
     'args,  kwargs, expected_exception, match',
     [(['dot'], {}, graphviz.RequiredArgumentError, r'filepath: \(required'),
@@ -127,3 +127,34 @@ def test_set_jupyter_format(monkeypatch, *, jupyter_format='jpg',
 
     assert g1._jupyter_mimetype == DEFAULT_JUPYTER_MIMETYPE
     assert g2._jupyter_mimetype == DEFAULT_JUPYTER_MIMETYPE
+
+
+def test_set_pipe_cache_size(monkeypatch, *, maxsize=2):
+    from graphviz.backend import caching
+    assert caching.PIPE_CACHE.maxsize == 0
+
+    # isolate the test
+    monkeypatch.setattr('graphviz.backend.caching.PIPE_CACHE', caching.PipeCache())
+
+    old = graphviz.set_pipe_cache_size(maxsize)
+    assert old == 0
+    assert caching.PIPE_CACHE.maxsize == maxsize
+
+    for data in (b'spam', b'eggs', b'ham'):
+        caching.PIPE_CACHE.put(caching.PIPE_CACHE.make_key(['dot'], data), data)
+    assert len(caching.PIPE_CACHE) == maxsize
+
+    old = graphviz.set_pipe_cache_size(0)
+    assert old == maxsize
+    assert not len(caching.PIPE_CACHE)
+
+
+@pytest.mark.parametrize(
+    'maxsize, expected_exception',
+    [(-1, ValueError),
+     (None, TypeError),
+     (1.5, TypeError),
+     (True, TypeError)])
+def test_set_pipe_cache_size_invalid(maxsize, expected_exception):
+    with pytest.raises(expected_exception, match=r'maxsize'):
+        graphviz.set_pipe_cache_size(maxsize)